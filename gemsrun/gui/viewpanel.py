@@ -67,7 +67,7 @@ from gemsrun.gui.viewpanelutils import get_custom_cursors
 from gemsrun.utils import audiocache, audioutils, gemsutils as gu
 from gemsrun.utils.apputils import get_resource
 from gemsrun.utils.polygon_utils import json_to_points, points_to_bounding_rect, scale_points
-from gemsrun.utils.safestrfunc import func_str_parts, get_param, is_safe_value
+from gemsrun.utils.safestrfunc import func_str_parts, is_safe_call
 
 if TYPE_CHECKING:  # Avoid circular import at runtime
     from .mainwindow import MainWin
@@ -1096,7 +1096,7 @@ class ViewPanel(QWidget):
     def safe_eval(self, expression: str):
         # get parts
         try:
-            fn, param_list = func_str_parts(cmd=expression)
+            fn, _ = func_str_parts(cmd=expression)
         except Exception:
             log.critical(f"ERROR: '{expression}' is an Unknown or mis-parameterized function string.")
             return None
@@ -1110,11 +1110,9 @@ class ViewPanel(QWidget):
             log.critical(str(e))
             return None
 
-        # make sure params only contain values
-        param_values = [get_param(item) for item in param_list]
-        ok_params = [is_safe_value(val) for val in param_values]
-
-        if all(ok_params):
+        # make sure params only contain values (checks the same string that gets eval'd)
+        expression = expression.strip()
+        if is_safe_call(expression):
             return eval(f"self.{expression}")  # NOTE: before you freak out about eval(), see the safestrfunc module
         log.critical("ERROR: The GEMS API only supports constant values as method parameters (including list items).")
         return None
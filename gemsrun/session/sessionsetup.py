@@ -31,6 +31,7 @@ from gemsrun.utils.gemsutils import (
     create_temporary_folder,
     func_name,
     get_image_dims,
+    media_file_names,
 )
 from gemsrun.utils.polygon_utils import has_old_style_bounds
 from gemsrun.utils.ttsutils import find_tts_folder, render_tts_from_google
@@ -316,6 +317,8 @@ def check_media(db: Munch, media_folder: Path) -> tuple:
     image_files += [view.Background for view in db.Views.values()]
     image_files += [view.Overlay for view in db.Views.values()]
     image_files += [db.Global.Options.Globaloverlay]
-    image_files = [img for img in image_files if img]
-    missing = [afile for afile in image_files if not Path(media_folder, afile).is_file()]
-    return tuple(set(missing))
+    image_files = {img for img in image_files if img}
+    # answer from one directory listing; only names not found there (e.g., subfolder paths) are stat'ed
+    present = media_file_names(media_folder)
+    missing = [afile for afile in image_files if afile not in present and not Path(media_folder, afile).is_file()]
+    return tuple(missing)
@@ -16,16 +16,21 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+import atexit
 from collections.abc import Callable
+import json
 import os
 from pathlib import Path
 import re
 import shutil
+import tempfile
+import threading
 import wave
 
 from munch import Munch
 
 from gemsrun import log
+from gemsrun.utils import audiosettings
 
 # Suppress pygame welcome message before importing
 os.environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
@@ -38,6 +43,83 @@ COMPRESSED_FORMATS = {".mp3", ".ogg", ".flac"}
 # Cache folder location
 CACHE_FOLDER = Path.home() / "Documents" / "GEMS" / "Cache"
 
+# Audio durations (msec) keyed by (path, st_mtime_ns), persisted so a player can report a duration
+# before it has decoded its file. Values are rounded estimates, not sample-exact.
+_DURATIONS: dict[tuple[str, int], int] = {}
+_DURATIONS_FILE = CACHE_FOLDER / "audio_durations.json"
+_durations_lock = threading.Lock()
+_durations_dirty = False
+
+
+def _load_durations():
+    """Read persisted audio durations from a previous run (if any)"""
+    try:
+        with open(_DURATIONS_FILE, encoding="utf-8") as f:
+            for path, mtime_ns, msec in json.load(f):
+                _DURATIONS[(path, mtime_ns)] = msec
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        log.debug(f"Ignoring unreadable audio duration cache {_DURATIONS_FILE}: {e}")
+
+
+def _is_current(path: str, mtime_ns: int) -> bool:
+    """True if path still exists with the modification time a duration was recorded for"""
+    try:
+        return os.stat(path).st_mtime_ns == mtime_ns
+    except OSError:
+        return False
+
+
+def _save_durations():
+    """Atomically write audio durations to disk if any were added this run, dropping stale entries"""
+    if not _durations_dirty:
+        return
+    with _durations_lock:
+        entries = list(_DURATIONS.items())
+    try:
+        # files that were edited or removed since their duration was recorded can never match again
+        rows = [[path, mtime_ns, msec] for (path, mtime_ns), msec in entries if _is_current(path, mtime_ns)]
+        _DURATIONS_FILE.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=_DURATIONS_FILE.parent, prefix=".audio_durations.", suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(rows, f)
+        os.replace(tmp_name, _DURATIONS_FILE)
+    except Exception as e:
+        log.debug(f"Error saving audio duration cache: {e}")
+
+
+def get_duration(path: str, mtime_ns: int) -> int | None:
+    """Recorded duration (msec) of path at the given modification time, or None if unknown."""
+    return _DURATIONS.get((path, mtime_ns))
+
+
+def remember_duration(path: str, mtime_ns: int, msec: int) -> None:
+    """Record the duration (msec) of path at the given modification time."""
+    global _durations_dirty
+    key = (path, mtime_ns)
+    with _durations_lock:
+        if _DURATIONS.get(key) != msec:
+            _DURATIONS[key] = msec
+            _durations_dirty = True
+
+
+def _remember_wav_duration(wav_path: Path) -> None:
+    """Record a WAV's duration from its header (no decoding) if it isn't known yet."""
+    try:
+        mtime_ns = wav_path.stat().st_mtime_ns
+        if get_duration(str(wav_path), mtime_ns) is not None:
+            return
+        with wave.open(str(wav_path), "rb") as wav_file:
+            msec = int(wav_file.getnframes() * 1000 / wav_file.getframerate())
+        remember_duration(str(wav_path), mtime_ns, msec)
+    except Exception as e:
+        log.debug(f"Could not read duration of {wav_path}: {e}")
+
+
+_load_durations()
+atexit.register(_save_durations)
+
 
 def get_cache_folder() -> Path:
     """Get the cache folder path, creating it if necessary."""
@@ -73,6 +155,44 @@ def is_cached(original_path: str | Path) -> bool:
     return get_cached_wav_path(original_path).exists()
 
 
+def write_wav(sound: mixer.Sound, dest_path: str | Path) -> None:
+    """
+    Write an already decoded pygame Sound to dest_path as a WAV file.
+
+    The file is written under a unique temporary name and then renamed into place,
+    so a reader never sees a partially written WAV (even if two writers race).
+    """
+    dest_path = Path(dest_path)
+
+    # Get raw audio data
+    raw_data = sound.get_raw()
+
+    # Get mixer settings to determine WAV parameters
+    frequency, format_bits, channels = mixer.get_init()
+
+    # Convert format_bits to sample width in bytes
+    # pygame uses negative values for signed formats
+    sample_width = abs(format_bits) // 8
+
+    # Write to WAV file
+    dest_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=dest_path.parent, prefix=f".{dest_path.name}.", suffix=".tmp")
+    tmp_path = Path(tmp_name)
+    try:
+        with os.fdopen(fd, "wb") as tmp_file, wave.open(tmp_file, "wb") as wav_file:
+            wav_file.setnchannels(channels)
+            wav_file.setsampwidth(sample_width)
+            wav_file.setframerate(frequency)
+            wav_file.writeframes(raw_data)
+        os.replace(tmp_path, dest_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    # The samples are already decoded here, so record the duration for whoever plays this WAV
+    remember_duration(str(dest_path), dest_path.stat().st_mtime_ns, int(sound.get_length() * 1000))
+
+
 def convert_to_wav(source_path: str | Path, dest_path: str | Path) -> bool:
     """
     Convert a compressed audio file to WAV format using pygame.
@@ -86,7 +206,9 @@ def convert_to_wav(source_path: str | Path, dest_path: str | Path) -> bool:
     # Ensure mixer is initialized
     if not mixer.get_init():
         try:
-            mixer.init(frequency=44100, size=-16, channels=2, buffer=512)
+            mixer.init(
+                frequency=audiosettings.pick_frequency(), size=-16, channels=2, buffer=audiosettings.pick_buffer()
+            )
         except Exception as e:
             log.error(f"Failed to initialize mixer for conversion: {e}")
             return False
@@ -94,25 +216,7 @@ def convert_to_wav(source_path: str | Path, dest_path: str | Path) -> bool:
     try:
         # Load the sound (pygame decodes compressed formats)
         sound = mixer.Sound(str(source_path))
-
-        # Get raw audio data
-        raw_data = sound.get_raw()
-
-        # Get mixer settings to determine WAV parameters
-        frequency, format_bits, channels = mixer.get_init()
-
-        # Convert format_bits to sample width in bytes
-        # pygame uses negative values for signed formats
-        sample_width = abs(format_bits) // 8
-
-        # Write to WAV file
-        dest_path.parent.mkdir(parents=True, exist_ok=True)
-        with wave.open(str(dest_path), "wb") as wav_file:
-            wav_file.setnchannels(channels)
-            wav_file.setsampwidth(sample_width)
-            wav_file.setframerate(frequency)
-            wav_file.writeframes(raw_data)
-
+        write_wav(sound, dest_path)
         log.debug(f"    CACHE CREATED: {source_path.name} -> {dest_path.name}")
         return True
 
@@ -140,6 +244,7 @@ def ensure_cached(original_path: str | Path) -> Path | None:
 
     if cached_path.exists():
         log.debug(f"    CACHE EXISTS: {original.name} -> {cached_path.name}")
+        _remember_wav_duration(cached_path)
         return cached_path
 
     log.debug(f"    CACHE CONVERTING: {original.name}...")
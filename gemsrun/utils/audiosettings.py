@@ -0,0 +1,56 @@
+"""
+GEMSrun: Environment Runner for GEMS (Graphical Environment Management System)
+Copyright (C) 2025 Travis L. Seymour, PhD
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import math
+import os
+
+from gemsrun import log
+
+"""
+Mixer settings shared by everything that initializes pygame.mixer, so playback and WAV conversion
+open the mixer the same way.
+"""
+
+
+def pick_buffer() -> int:
+    """
+    Mixer buffer size in sample frames, from the GEMS_AUDIO_BUFFER environment variable (default 512).
+    A smaller buffer gets a sound to the output device sooner (512 frames at 48 kHz is ~11ms), but
+    leaves the audio thread less slack; too small and the device runs dry between callbacks, which is
+    heard as crackling. Raise it on machines that crackle, lower it where latency matters more.
+    The value is rounded to the nearest power of two and clamped to 128..4096.
+    """
+    try:
+        requested = int(os.environ.get("GEMS_AUDIO_BUFFER", "512"))
+    except ValueError:
+        log.warning("Ignoring invalid GEMS_AUDIO_BUFFER={!r}", os.environ["GEMS_AUDIO_BUFFER"])
+        requested = 512
+    requested = min(4096, max(128, requested))
+    return 1 << round(math.log2(requested))
+
+
+def pick_frequency() -> int:
+    """Mixer sample rate in Hz, from the GEMS_AUDIO_FREQUENCY environment variable (default 48000)."""
+    try:
+        frequency = int(os.environ.get("GEMS_AUDIO_FREQUENCY", "48000"))
+        if frequency <= 0:
+            raise ValueError
+        return frequency
+    except ValueError:
+        log.warning("Ignoring invalid GEMS_AUDIO_FREQUENCY={!r}", os.environ["GEMS_AUDIO_FREQUENCY"])
+        return 48000
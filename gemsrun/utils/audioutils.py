@@ -17,19 +17,24 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
 import atexit
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import os
 from pathlib import Path
+import stat
 import threading
+import time
 from typing import Any
+import weakref
 
 # Suppress pygame welcome message before importing
 os.environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
 
-from pygame import mixer as pygame_mixer  # For music module access
 import pygame.mixer as mixer
 from PySide6.QtCore import QObject, QTimer, Signal
 
 from gemsrun import log
+from gemsrun.utils import audiocache, audiosettings
 
 # Track current background music file for logging
 _current_background_music: str | None = None
@@ -39,31 +44,208 @@ Cross-platform audio utilities for GEMSrun using pygame.mixer
 Provides simple, reliable audio playback across Windows, macOS, and Linux
 """
 
+
 # Initialize pygame mixer once at module load
-# frequency=44100, size=-16, channels=2, buffer=512 are good defaults
+# frequency=48000, size=-16, channels=2, buffer=512 are good defaults
+# (frequency and buffer can be overridden with GEMS_AUDIO_FREQUENCY / GEMS_AUDIO_BUFFER)
+# 48000 Hz is the native rate of most current output devices, so the OS audio stack
+# (CoreAudio/WASAPI/PipeWire) doesn't have to resample every mixer buffer. Assets at
+# other rates are still converted by SDL, but only once when they are loaded.
 # buffer=512 provides low latency without crackling
 try:
-    mixer.init(frequency=44100, size=-16, channels=2, buffer=512)
+    mixer.init(frequency=audiosettings.pick_frequency(), size=-16, channels=2, buffer=audiosettings.pick_buffer())
     MIXER_AVAILABLE = True
+    # The channel count never changes after init, so probe it once here
+    _NUM_CHANNELS = mixer.get_num_channels()
     log.info("pygame.mixer initialized successfully")
 except Exception as e:
     MIXER_AVAILABLE = False
-    log.error(f"Failed to initialize pygame.mixer: {e}")
+    _NUM_CHANNELS = 0
+    log.error("Failed to initialize pygame.mixer: {}", e)
 
 
 def _cleanup_mixer():
     """Cleanup function to be called at exit"""
     if MIXER_AVAILABLE:
         try:
+            _cached_sound.cache_clear()
             mixer.quit()
             log.debug("pygame.mixer cleaned up")
         except Exception as e:
-            log.debug(f"Error cleaning up pygame.mixer: {e}")
+            log.debug("Error cleaning up pygame.mixer: {}", e)
 
 
 # Register cleanup function to run at exit
 atexit.register(_cleanup_mixer)
 
+# Sounds are loaded on these shared worker threads rather than a new thread per first play
+_LOAD_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="gems-audio-load")
+atexit.register(_LOAD_POOL.shutdown, wait=False)
+
+# WAV cache writes (see _cache_decoded) get their own worker so a long write never holds up loading
+_WAV_WRITER = ThreadPoolExecutor(max_workers=1, thread_name_prefix="gems-audio-wav")
+atexit.register(_WAV_WRITER.shutdown, wait=False)
+# cached WAV paths with a write queued or running
+_wav_writes_pending: set[Path] = set()
+_wav_writes_lock = threading.Lock()
+
+# Volume changes smaller than this are inaudible (below 16-bit quantization), so
+# set_volume() skips re-applying them to the mixer (e.g., during fades)
+_VOLUME_EPSILON = 1.0 / 512.0
+
+# Short cues (files smaller than this on disk) are decoded once and their Sound
+# shared by every player of that file (see _cached_sound)
+_SOUND_CACHE_MAX_SIZE = 1024 * 1024
+
+# How long (sec) is_playing() may reuse its last answer before asking SDL again
+_IS_PLAYING_TTL = 0.01
+
+# find_channel() + play() is not atomic, and sounds are started from the load pool as well as the
+# main thread, so channel starts (and every channel operation) hold this lock. Each channel also
+# remembers the player that started it last: a player whose sound has ended must not change or stop
+# the sound that another player has since been given that channel for.
+_CHANNEL_LOCK = threading.Lock()
+_CHANNEL_OWNERS: "weakref.WeakValueDictionary[int, CrossPlatformAudioPlayer]" = weakref.WeakValueDictionary()
+
+
+def _remember_duration(key: tuple[str, int] | None, sound) -> int:
+    """Store (and return) the duration of a loaded sound under key (see audiocache.remember_duration)"""
+    # pygame Sound.get_length() returns seconds as float
+    msec = int(sound.get_length() * 1000)
+    if key is not None:
+        audiocache.remember_duration(*key, msec)
+    return msec
+
+
+@lru_cache(maxsize=64)
+def _cached_sound(sound_file: str, mtime_ns: int) -> mixer.Sound:
+    """
+    Decode a short sound once and share it across players. The mtime is part of the key
+    so an edited file is decoded again. Shared Sounds stay at full volume; each player
+    applies its own volume to the channel it plays on.
+    """
+    return mixer.Sound(sound_file)
+
+
+def _open_sound(sound_file: str, file_stat: os.stat_result) -> mixer.Sound:
+    """
+    Decode sound_file into a pygame Sound.
+    Short files come from the shared Sound cache, so replaying a cue from a new player
+    costs neither a decode nor a new sample buffer.
+    Larger files are loaded by path, which lets SDL read them directly.
+    """
+    if file_stat.st_size < _SOUND_CACHE_MAX_SIZE:
+        return _cached_sound(sound_file, file_stat.st_mtime_ns)
+    return mixer.Sound(sound_file)
+
+
+def _write_wav_cache(sound: mixer.Sound, cached_path) -> None:
+    """WAV writer task: save a decoded compressed sound as its cached WAV"""
+    try:
+        audiocache.write_wav(sound, cached_path)
+        log.debug("Cached decoded audio as {}", cached_path)
+    except Exception as e:
+        log.debug("Could not cache decoded audio as {}: {}", cached_path, e)
+    finally:
+        with _wav_writes_lock:
+            _wav_writes_pending.discard(cached_path)
+
+
+def _cache_decoded(sound_file: str, sound: mixer.Sound) -> None:
+    """
+    Compressed files that weren't converted ahead of time (see audiocache.preload_audio_files)
+    are written out as WAV from the samples just decoded, so the next load skips the decoder.
+    """
+    if not audiocache.is_compressed_audio(sound_file):
+        return
+    cached_path = audiocache.get_cached_wav_path(sound_file)
+    with _wav_writes_lock:
+        # players loading the same file before the first write finishes share that write
+        if cached_path in _wav_writes_pending or cached_path.exists():
+            return
+        _wav_writes_pending.add(cached_path)
+    _WAV_WRITER.submit(_write_wav_cache, sound, cached_path)
+
+
+class _PlaybackMonitor(QObject):
+    """
+    One shared timer that watches every playing (non-looping) sound for completion,
+    instead of each player running its own QTimer with its own phase.
+    It also keeps looping background music queued (see play_background_music).
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._players: weakref.WeakSet[CrossPlatformAudioPlayer] = weakref.WeakSet()
+        self._music_file: str | None = None
+        self._music_pos = 0
+        self._timer = QTimer(self)
+        self._timer.setInterval(50)  # Check every 50ms
+        self._timer.timeout.connect(self._sweep)
+
+    def register(self, player: "CrossPlatformAudioPlayer"):
+        self._players.add(player)
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def unregister(self, player: "CrossPlatformAudioPlayer"):
+        self._players.discard(player)
+        if not self._players and self._music_file is None:
+            self._timer.stop()
+
+    def watch_music(self, sound_file: str | None):
+        """Keep sound_file queued behind itself (None stops watching background music)"""
+        self._music_file = sound_file
+        self._music_pos = 0
+        if sound_file is not None and not self._timer.isActive():
+            self._timer.start()
+
+    def _requeue_music(self):
+        """Queue the next pass of looping background music once the current one starts"""
+        if not mixer.music.get_busy():
+            # The main thread stalled for longer than a whole pass, so the queued pass ran out
+            # before it could be re-queued. (stop_background_music stops watching before it stops
+            # the music, so this is never an intended stop.) Start the loop again.
+            try:
+                mixer.music.load(self._music_file)
+                mixer.music.play(loops=0)
+                mixer.music.queue(self._music_file)
+                log.debug("Restarted looping background music after a stall: {}", self._music_file)
+            except Exception as e:
+                log.error("Failed to restart looping background music {}: {}", self._music_file, e)
+                self._music_file = None
+            self._music_pos = 0
+            return
+        # get_pos() restarts from 0 when SDL_mixer switches to the queued track
+        pos = mixer.music.get_pos()
+        if pos < self._music_pos:
+            mixer.music.queue(self._music_file)
+        self._music_pos = pos
+
+    def _sweep(self):
+        """Check all players once, then emit finished signals for those that are done"""
+        finished = [player for player in list(self._players) if player._check_playback_status()]
+        for player in finished:
+            self._players.discard(player)
+        if self._music_file is not None:
+            self._requeue_music()
+        if not self._players and self._music_file is None:
+            self._timer.stop()
+
+        for player in finished:
+            QTimer.singleShot(0, player.playback_finished.emit)
+
+
+_playback_monitor: _PlaybackMonitor | None = None
+
+
+def _get_playback_monitor() -> _PlaybackMonitor:
+    """Get the shared playback monitor, creating it on first use (main thread only)"""
+    global _playback_monitor
+    if _playback_monitor is None:
+        _playback_monitor = _PlaybackMonitor()
+    return _playback_monitor
+
 
 class CrossPlatformAudioPlayer(QObject):
     """
@@ -80,42 +262,50 @@ class CrossPlatformAudioPlayer(QObject):
     def __init__(self, sound_file: str, volume: float = 1.0, loop: bool = False):
         super().__init__()
         self.sound_file = sound_file
-        self.volume = max(0.0, min(1.0, volume))  # Clamp between 0 and 1
+        self.volume = 0.0 if volume < 0.0 else 1.0 if volume > 1.0 else volume  # Clamp between 0 and 1
+        self._last_applied_volume = -1.0
         self.loop = loop
         self.sound = None
         self.channel = None
-        self.monitor_timer = None
+        self._is_playing_cache = (0.0, False)  # (monotonic expiry, value)
         self._was_playing = False
-        self._load_attempted = False
-        self._is_loading = False
         self._pending_play = False
-        self._load_lock = threading.Lock()
+        # Only the loader thread assigns self.sound; these events order that write against
+        # readers on the main thread without taking a lock on the play() fast path.
+        self._load_started = threading.Event()
+        self._load_done = threading.Event()
 
         # Connect internal signal for thread-safe playback trigger
         self._load_complete.connect(self._on_load_complete)
 
-        # Verify file exists, but don't load yet (will load in background on play())
-        sound_path = Path(sound_file)
-        if not sound_path.exists():
+        # Verify file exists, but don't load yet (will load in background on play()).
+        # The stat result is kept so loading and the duration cache don't stat again.
+        try:
+            st = os.stat(sound_file)
+        except OSError:
+            st = None
+        # same test as os.path.isfile(), without a second stat
+        self._stat = st if st is not None and stat.S_ISREG(st.st_mode) else None
+        if self._stat is None:
             error_msg = f"Audio file not found: {sound_file}"
             log.error(error_msg)
             # Don't emit signal here - QObject might not be fully initialized
+        self._duration_key = (sound_file, self._stat.st_mtime_ns) if self._stat else None
+        self._duration_ms = (audiocache.get_duration(*self._duration_key) or 0) if self._duration_key else 0
 
     def _load_sound_sync(self) -> bool:
         """Synchronously load the sound file (called from background thread or direct)"""
         try:
-            sound_path = Path(self.sound_file)
-            if not sound_path.exists():
+            if self._stat is None:
                 raise FileNotFoundError(f"Audio file not found: {self.sound_file}")
 
-            log.debug(f"Loading audio file: {self.sound_file}")
-            sound = mixer.Sound(str(sound_path))
-            sound.set_volume(self.volume)
+            log.debug("Loading audio file: {}", self.sound_file)
+            sound = _open_sound(self.sound_file, self._stat)
+            self._duration_ms = _remember_duration(self._duration_key, sound)
+            self.sound = sound
+            _cache_decoded(self.sound_file, sound)
 
-            with self._load_lock:
-                self.sound = sound
-
-            log.debug(f"Loaded audio file: {self.sound_file}")
+            log.debug("Loaded audio file: {}", self.sound_file)
             return True
 
         except Exception as e:
@@ -124,19 +314,21 @@ class CrossPlatformAudioPlayer(QObject):
             return False
 
     def _load_and_play_background(self):
-        """Background thread function to load and play audio"""
-        with self._load_lock:
-            if self._load_attempted:
-                return
-            self._load_attempted = True
-            self._is_loading = True
-
+        """Load pool task: load the audio, then play it if play() was called meanwhile"""
         success = self._load_sound_sync()
 
-        with self._load_lock:
-            self._is_loading = False
+        # Sound.play() is thread-safe, so start playback right here rather than waiting
+        # for the main thread to pick up _load_complete. If it fails, _pending_play stays
+        # set and _on_load_complete retries (and reports the error) on the main thread.
+        if success and self._pending_play:
+            try:
+                self._start_channel()
+            except Exception as e:
+                log.debug("Background playback start failed, deferring to main thread: {}", e)
+
+        self._load_done.set()
 
-        # Emit signal to trigger playback on main thread (thread-safe)
+        # Emit signal so the main thread can finish up (start monitoring or report errors)
         self._load_complete.emit(success)
 
     def _on_load_complete(self, success: bool):
@@ -144,34 +336,67 @@ class CrossPlatformAudioPlayer(QObject):
         if success and self._pending_play:
             log.debug("Load complete, playing audio now")
             self._do_play()
+        elif success and self._was_playing:
+            # playback was already started by the background thread
+            self._start_monitor()
         elif not success:
             error_msg = f"Failed to load audio file {self.sound_file}"
             log.error(error_msg)
             self.playback_error.emit(error_msg)
 
+    def _start_channel(self):
+        """Start the loaded sound on a free channel (safe to call from any thread)"""
+        # Play the sound, loop=-1 for infinite loop, 0 for once
+        loops = -1 if self.loop else 0
+        # The Sound may be shared with other players, so volume is set per channel,
+        # before the channel starts so the first buffer is already at the right level
+        with _CHANNEL_LOCK:
+            channel = mixer.find_channel()
+
+            if channel is None:
+                raise RuntimeError("No available audio channels")
+
+            channel.set_volume(self.volume)
+            channel.play(self.sound, loops=loops)
+            _CHANNEL_OWNERS[channel.id] = self
+            self.channel = channel
+            self._last_applied_volume = self.volume
+
+        self._was_playing = True
+        self._pending_play = False
+        self._is_playing_cache = (0.0, False)
+        log.info("Playing audio: {}, volume={}, loop={}", self.sound_file, self.volume, self.loop)
+
+    def _owned_channel(self) -> mixer.Channel | None:
+        """self.channel if this player started the sound now on it, else None (hold _CHANNEL_LOCK)"""
+        channel = self.channel
+        if channel is not None and _CHANNEL_OWNERS.get(channel.id) is not self:
+            self.channel = None
+            self._last_applied_volume = -1.0
+            return None
+        return channel
+
+    def _release_channel(self):
+        """Forget this player's channel (hold _CHANNEL_LOCK)"""
+        channel = self.channel
+        if channel is not None and _CHANNEL_OWNERS.get(channel.id) is self:
+            del _CHANNEL_OWNERS[channel.id]
+        self.channel = None
+        self._last_applied_volume = -1.0
+
+    def _start_monitor(self):
+        """Start monitoring playback state for non-looping sounds (main thread only)"""
+        if not self.loop:
+            _get_playback_monitor().register(self)
+
     def _do_play(self) -> bool:
         """Internal method to actually play the sound (assumes sound is loaded)"""
         if self.sound is None:
             return False
 
         try:
-            # Play the sound, loop=-1 for infinite loop, 0 for once
-            loops = -1 if self.loop else 0
-            self.channel = self.sound.play(loops=loops)
-
-            if self.channel is None:
-                raise RuntimeError("No available audio channels")
-
-            self._was_playing = True
-            self._pending_play = False
-            log.info(f"Playing audio: {self.sound_file}, volume={self.volume}, loop={self.loop}")
-
-            # Start monitoring playback state for non-looping sounds
-            if not self.loop:
-                self.monitor_timer = QTimer()
-                self.monitor_timer.timeout.connect(self._check_playback_status)
-                self.monitor_timer.start(100)  # Check every 100ms
-
+            self._start_channel()
+            self._start_monitor()
             return True
 
         except Exception as e:
@@ -188,94 +413,115 @@ class CrossPlatformAudioPlayer(QObject):
             self.playback_error.emit(error_msg)
             return False
 
-        with self._load_lock:
+        if self._load_done.is_set():
             # If already loaded, play immediately
             if self.sound is not None:
                 return self._do_play()
 
-            # If currently loading, just mark as pending
-            if self._is_loading:
-                self._pending_play = True
-                log.debug("Audio is loading, will play when ready")
-                return True
-
             # If already attempted and failed, don't try again
-            if self._load_attempted:
-                error_msg = "Audio file failed to load previously"
-                log.error(error_msg)
-                self.playback_error.emit(error_msg)
-                return False
+            error_msg = "Audio file failed to load previously"
+            log.error(error_msg)
+            self.playback_error.emit(error_msg)
+            return False
 
-            # Start background loading
+        # If currently loading, just mark as pending
+        if self._load_started.is_set():
             self._pending_play = True
-            log.debug(f"Starting background load for: {self.sound_file}")
-            thread = threading.Thread(target=self._load_and_play_background, daemon=True)
-            thread.start()
+            log.debug("Audio is loading, will play when ready")
             return True
 
+        # Start background loading
+        self._pending_play = True
+        self._load_started.set()
+        log.debug("Starting background load for: {}", self.sound_file)
+        _LOAD_POOL.submit(self._load_and_play_background)
+        return True
+
     def stop(self):
         """Stop audio playback"""
-        if self.monitor_timer:
-            self.monitor_timer.stop()
-            self.monitor_timer = None
-
-        if self.channel:
-            try:
-                self.channel.stop()
-                log.debug(f"Stopped audio: {self.sound_file}")
-            except Exception as e:
-                log.debug(f"Error stopping audio: {e}")
-            finally:
-                self.channel = None
-                self._was_playing = False
+        self._pending_play = False
+        if _playback_monitor is not None:
+            _playback_monitor.unregister(self)
+
+        with _CHANNEL_LOCK:
+            channel = self._owned_channel()
+            if channel is not None:
+                try:
+                    channel.stop()
+                    log.debug("Stopped audio: {}", self.sound_file)
+                except Exception as e:
+                    log.debug("Error stopping audio: {}", e)
+            self._release_channel()
+        self._was_playing = False
+        self._is_playing_cache = (0.0, False)
 
     def pause(self):
         """Pause audio playback"""
-        if self.channel:
-            try:
-                self.channel.pause()
-                log.debug(f"Paused audio: {self.sound_file}")
-            except Exception as e:
-                log.debug(f"Error pausing audio: {e}")
+        with _CHANNEL_LOCK:
+            channel = self._owned_channel()
+            if channel is not None:
+                try:
+                    channel.pause()
+                    log.debug("Paused audio: {}", self.sound_file)
+                except Exception as e:
+                    log.debug("Error pausing audio: {}", e)
 
     def resume(self):
         """Resume paused audio playback"""
-        if self.channel:
-            try:
-                self.channel.unpause()
-                log.debug(f"Resumed audio: {self.sound_file}")
-            except Exception as e:
-                log.debug(f"Error resuming audio: {e}")
+        with _CHANNEL_LOCK:
+            channel = self._owned_channel()
+            if channel is not None:
+                try:
+                    channel.unpause()
+                    log.debug("Resumed audio: {}", self.sound_file)
+                except Exception as e:
+                    log.debug("Error resuming audio: {}", e)
 
     def is_playing(self) -> bool:
-        """Check if audio is currently playing"""
-        if self.channel:
-            return self.channel.get_busy()
-        return False
+        """Check if audio is currently playing (answer may be up to 10ms old)"""
+        now = time.monotonic()
+        expiry, value = self._is_playing_cache
+        if now < expiry:
+            return value
+        with _CHANNEL_LOCK:
+            channel = self._owned_channel()
+            value = channel.get_busy() if channel is not None else False
+        self._is_playing_cache = (now + _IS_PLAYING_TTL, value)
+        return value
 
     def duration(self) -> int:
-        """Get audio duration in milliseconds"""
-        if self.sound:
-            # pygame Sound.get_length() returns seconds as float
-            return int(self.sound.get_length() * 1000)
-        return 0
+        """
+        Get audio duration in milliseconds (0 if not known yet).
+        This is a rounded estimate (not sample-exact). It comes from the duration cache,
+        so it is available before loading if this file was loaded on a previous run.
+        """
+        return self._duration_ms
+
+    def _check_playback_status(self) -> bool:
+        """Return True (once) when playback has finished; polled by the shared playback monitor"""
+        if self._was_playing and not self.is_playing():
+            self._was_playing = False
+            # the channel is free for other players now, so stop pointing at it
+            with _CHANNEL_LOCK:
+                self._release_channel()
+            log.debug("Playback finished: {}", self.sound_file)
+            return True
+        return False
 
     def set_volume(self, volume: float):
-        """Set playback volume (0.0 to 1.0)"""
-        self.volume = max(0.0, min(1.0, volume))
-        if self.sound:
-            self.sound.set_volume(self.volume)
-            log.debug(f"Set volume to {self.volume} for {self.sound_file}")
-
-    def _check_playback_status(self):
-        """Monitor playback status and emit finished signal when done"""
-        if not self.is_playing() and self._was_playing:
-            self._was_playing = False
-            if self.monitor_timer:
-                self.monitor_timer.stop()
-                self.monitor_timer = None
-            log.debug(f"Playback finished: {self.sound_file}")
-            self.playback_finished.emit()
+        """Set playback volume (0.0 to 1.0), skipping inaudible changes"""
+        v = 0.0 if volume < 0.0 else 1.0 if volume > 1.0 else volume
+        self.volume = v
+        if abs(v - self._last_applied_volume) < _VOLUME_EPSILON:
+            return
+        with _CHANNEL_LOCK:
+            channel = self._owned_channel()
+            # only while this player's sound is still on the channel
+            if channel is None or not channel.get_busy():
+                return
+            channel.set_volume(v)
+            self._last_applied_volume = v
+        log.debug("Set volume to {} for {}", v, self.sound_file)
 
 
 def get_audio_backend_info() -> dict[str, Any]:
@@ -285,7 +531,7 @@ def get_audio_backend_info() -> dict[str, Any]:
         "available": MIXER_AVAILABLE,
         "available_backends": ["pygame.mixer"] if MIXER_AVAILABLE else [],
         "mixer_initialized": mixer.get_init() is not None if MIXER_AVAILABLE else False,
-        "num_channels": mixer.get_num_channels() if MIXER_AVAILABLE else 0,
+        "num_channels": _NUM_CHANNELS,
     }
 
 
@@ -323,24 +569,29 @@ def play_background_music(sound_file: str, volume: float = 1.0, loop: bool = Fal
 
     try:
         # Stop any currently playing background music
-        if pygame_mixer.music.get_busy():
-            pygame_mixer.music.stop()
-            log.debug(f"Stopped previous background music: {_current_background_music}")
+        if mixer.music.get_busy():
+            mixer.music.stop()
+            log.debug("Stopped previous background music: {}", _current_background_music)
 
         # Load and play the new music
-        pygame_mixer.music.load(sound_file)
-        pygame_mixer.music.set_volume(max(0.0, min(1.0, volume)))
-
-        # -1 for infinite loop, 0 for play once
-        loops = -1 if loop else 0
-        pygame_mixer.music.play(loops=loops)
+        mixer.music.load(sound_file)
+        mixer.music.set_volume(max(0.0, min(1.0, volume)))
+
+        # Looping is done by keeping the same file queued rather than play(loops=-1), so
+        # SDL_mixer chains straight into the next pass instead of seeking back to the start
+        # (which leaves a small gap and a CPU spike on mp3/ogg). play() and load() both
+        # clear anything queued for the previous music.
+        mixer.music.play(loops=0)
+        if loop:
+            mixer.music.queue(sound_file)
+        _get_playback_monitor().watch_music(sound_file if loop else None)
 
         _current_background_music = sound_file
-        log.info(f"Playing background music: {sound_file}, volume={volume}, loop={loop}")
+        log.info("Playing background music: {}, volume={}, loop={}", sound_file, volume, loop)
         return True
 
     except Exception as e:
-        log.error(f"Failed to play background music {sound_file}: {e}")
+        log.error("Failed to play background music {}: {}", sound_file, e)
         return False
 
 
@@ -358,9 +609,11 @@ def stop_background_music() -> bool:
         return False
 
     try:
-        if pygame_mixer.music.get_busy():
-            pygame_mixer.music.stop()
-            log.info(f"Stopped background music: {_current_background_music}")
+        if _playback_monitor is not None:
+            _playback_monitor.watch_music(None)
+        if mixer.music.get_busy():
+            mixer.music.stop()
+            log.info("Stopped background music: {}", _current_background_music)
             _current_background_music = None
             return True
         else:
@@ -368,7 +621,7 @@ def stop_background_music() -> bool:
             return False
 
     except Exception as e:
-        log.error(f"Failed to stop background music: {e}")
+        log.error("Failed to stop background music: {}", e)
         return False
 
 
@@ -377,7 +630,7 @@ def is_background_music_playing() -> bool:
     if not MIXER_AVAILABLE:
         return False
     try:
-        return pygame_mixer.music.get_busy()
+        return mixer.music.get_busy()
     except Exception:
         return False
 
@@ -386,6 +639,6 @@ def set_background_music_volume(volume: float) -> None:
     """Set the volume for background music (0.0 to 1.0)."""
     if MIXER_AVAILABLE:
         try:
-            pygame_mixer.music.set_volume(max(0.0, min(1.0, volume)))
+            mixer.music.set_volume(max(0.0, min(1.0, volume)))
         except Exception as e:
-            log.error(f"Failed to set background music volume: {e}")
+            log.error("Failed to set background music volume: {}", e)
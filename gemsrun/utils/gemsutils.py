@@ -16,27 +16,43 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+import atexit
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 import hashlib
-import inspect
 import os
 from pathlib import Path
 import shutil
 import socket
+import sys
 import tempfile
+import threading
 import time
-import traceback
 
 from PIL import Image
 
 from gemsrun import log
 
 
+def _remove_old_temporary_folders(tmpdir: str):
+    """deletes temp folders set aside by create_temporary_folder (including any left by earlier runs)"""
+    for old_folder in Path(tmpdir).glob("gemsruntemp.old.*"):
+        shutil.rmtree(old_folder, ignore_errors=True)
+
+
 def create_temporary_folder() -> Path:
     tmpdir = tempfile.gettempdir()
     temp_folder = Path(tmpdir, "gemsruntemp")
-    # if it exists, recursively delete it
+    # if it exists, rename it out of the way (one cheap syscall) and recursively delete it
+    # in the background, so startup doesn't wait on unlinking every cached file
     if temp_folder.is_dir():
-        shutil.rmtree(temp_folder)
+        old_folder = temp_folder.with_name(f"gemsruntemp.old.{os.getpid()}")
+        try:
+            os.replace(temp_folder, old_folder)
+        except OSError:
+            # can't rename it (e.g., a file inside is open on Windows), so delete it in place
+            shutil.rmtree(temp_folder)
+        threading.Thread(target=_remove_old_temporary_folders, args=(tmpdir,), daemon=True).start()
     # if it still exists, continue trying to use it anyway
     # create new version of tmp folder
     temp_folder.mkdir(exist_ok=True)
@@ -45,42 +61,67 @@ def create_temporary_folder() -> Path:
     return temp_folder
 
 
-def check_media(db_filename, database, media_folder) -> tuple:
-    outcomelist = []
+def media_file_names(media_folder) -> set[str]:
+    """
+    returns the names of all regular files directly inside media_folder (empty if it can't be read).
+    One directory scan is much cheaper than a stat() per referenced media file.
+    """
+    try:
+        with os.scandir(media_folder) as entries:
+            return {entry.name for entry in entries if entry.is_file()}
+    except OSError:
+        return set()
 
-    cursor = database.cursor()
-    # load all the views images
-    cursor.execute("SELECT Foreground, Background, Overlay FROM views")
-    all_records = cursor.fetchall()
 
-    # define a helper function
-    def file_ok(file_name: str):
-        return (not file_name) or os.path.isfile(os.path.join(media_folder, os.path.basename(file_name)))
+def check_media(db_filename, database, media_folder) -> tuple:
+    cursor = database.cursor()
+    # load the distinct, non-empty view image names (views often share images; UNION drops the repeats)
+    cursor.execute(
+        "SELECT Foreground FROM views WHERE Foreground <> '' "
+        "UNION SELECT Background FROM views WHERE Background <> '' "
+        "UNION SELECT Overlay FROM views WHERE Overlay <> ''"
+    )
+    present = media_file_names(media_folder)
 
-    # loop through and update outcomelist with any missing files
-    for record in all_records:
-        for file in record:
-            if file_ok(file) is False:
-                outcomelist.append(file)
-    return tuple(set(outcomelist))
+    # local bindings skip the per-file attribute lookups
+    basename = os.path.basename
+    present_contains = present.__contains__
+    return tuple(file for (file,) in cursor.fetchall() if not present_contains(basename(file)))
 
 
 def func_name():
     """https://stackoverflow.com/questions/251464/how-to-get-a-function-name-as-a-string-in-python"""
-    return traceback.extract_stack(None, 2)[0][2]
+    # read the caller's frame directly; extract_stack would build a FrameSummary list first
+    return sys._getframe(1).f_code.co_name
 
 
 def func_params():
     """https://stackoverflow.com/questions/251464/how-to-get-a-function-name-as-a-string-in-python"""
-    # for method, must dump self key and add frame's name (that's the function name)
-    frame = inspect.currentframe().f_back
-    # print(frame.f_code.co_name)
-    args, _, _, values = inspect.getargvalues(frame)
-    res = {i: values[i] for i in args}
-    if "self" in res:
-        del res["self"]
+    # for method, must dump self key
+    frame = sys._getframe(1)
+    code = frame.f_code
+    # named parameters come first in co_varnames (same set inspect.getargvalues reports, minus *args/**kwargs)
+    names = code.co_varnames[: code.co_argcount + code.co_kwonlyargcount]
+    values = frame.f_locals
+    return {name: values[name] for name in names if name != "self"}
 
-    return res
+
+# time.monotonic() of the last successful check_connectivity(); a success this recent is reused
+_last_connectivity_ok: float | None = None
+_CONNECTIVITY_TTL = 30.0
+
+# Worker threads for connectivity probes, kept for the life of the process rather than created per check
+_CONN_EXECUTOR = ThreadPoolExecutor(max_workers=3, thread_name_prefix="gems-conn")
+atexit.register(_CONN_EXECUTOR.shutdown, wait=False)
+
+
+def _probe_host(host: str, port: int, timeout: float) -> bool:
+    # a TCP handshake is all a liveness probe needs (no TLS or HTTP round trips)
+    try:
+        with socket.create_connection((host, port), timeout=timeout):
+            return True
+    except OSError:
+        return False
 
 
 def check_connectivity(timeout: float = 3.0) -> bool:
@@ -92,7 +133,16 @@ def check_connectivity(timeout: float = 3.0) -> bool:
     - No rate limiting concerns
     - Uses only standard library
     - DNS servers have very high uptime (99.999%)
+
+    All hosts are probed at once, so an offline check costs one timeout rather than one per host.
+    A successful result is remembered for 30 seconds, so repeated checks in that window return immediately.
+    Failures are not remembered, so a later call can notice that the connection came back.
     """
+    global _last_connectivity_ok
+
+    if _last_connectivity_ok is not None and time.monotonic() - _last_connectivity_ok < _CONNECTIVITY_TTL:
+        return True
+
     hosts = [
         ("8.8.8.8", 53),  # Google DNS
         ("1.1.1.1", 53),  # Cloudflare DNS
@@ -102,30 +152,32 @@ def check_connectivity(timeout: float = 3.0) -> bool:
     log.debug("starting connectivity check...")
     start = time.perf_counter()
 
-    for host, port in hosts:
-        try:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                s.settimeout(timeout)
-                s.connect((host, port))
-                elapsed = time.perf_counter() - start
-                log.debug(f"connectivity confirmed via {host}:{port} in {elapsed:.4f} sec.")
-                return True
-        except OSError:
-            continue
+    futures = {_CONN_EXECUTOR.submit(_probe_host, host, port, timeout): (host, port) for host, port in hosts}
+    for future in as_completed(futures):
+        if future.result():
+            host, port = futures[future]
+            elapsed = time.perf_counter() - start
+            log.debug(f"connectivity confirmed via {host}:{port} in {elapsed:.4f} sec.")
+            _last_connectivity_ok = time.monotonic()
+            return True
 
     elapsed = time.perf_counter() - start
     log.warning(f"connectivity check failed after {elapsed:.4f} sec (tried {len(hosts)} hosts)")
     return False
 
 
+@lru_cache(maxsize=4096)
 def string_hash(s: str) -> str:
-    ho = hashlib.md5(s.strip().encode())
-    return ho.hexdigest()
+    # BLAKE2b is faster than MD5 on 64-bit CPUs and isn't restricted under FIPS mode;
+    # a 16-byte digest keeps the result at 32 hex characters, same as MD5
+    return hashlib.blake2b(s.strip().encode(), digest_size=16).hexdigest()
 
 
 def get_image_dims(img_file: Path) -> tuple[int, int]:
-    im = Image.open(img_file)
-    return im.size
+    # Image.open() only parses the header, so reading .size never decodes pixels;
+    # the with-block closes the file right away instead of leaving it to the GC.
+    with Image.open(img_file) as im:
+        return im.size
 
 
 def boundary(min_value: int | float, my_value: int | float, max_value: int | float):
@@ -138,4 +190,4 @@ def boundary(min_value: int | float, my_value: int | float, max_value: int | flo
 
 
 if __name__ == "__main__":
-    print(check_connectivity("https://www.google.com"))
+    print(check_connectivity())
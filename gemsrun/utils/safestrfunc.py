@@ -17,131 +17,137 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
 import ast
+from functools import lru_cache
+from itertools import chain
 import re
 
-import regex
-
 """
 This module contains tools that allow for the safe eval()'ing of method calls.
 The focus of this module is making sure function parameters are only constant types.
 This thwarts attempts to insert arbitrary Python expressions/calls as function parameters.
 It limits arguments to constants of basic types such as ints, float, strings, etc. It allows lists and tuples,
 but only those that only contain constants (checks recursively).
+The same action strings are checked over and over while a task runs, so the parsing functions are memoized
+on their (string) input; the tuples they return are shared between callers and must not be modified.
 """
 
+# Compiled once here rather than on every call
+_WHITESPACE = re.compile(r"\s+")
+
 
+@lru_cache(maxsize=4096)
 def get_param(param: str) -> str:
     """
     takes a parameter argument and returns only the argument value,
     just in case the parameter name is included.
     E.g., 'enabled=True' and 'True' both return 'True'
     """
+    param = param.strip()
+    name, equals, value = param.partition("=")
+    if equals and name.rstrip().isidentifier():
+        return value.lstrip()
+    return param
+
+
+def _parse_call(cmd: str) -> ast.Call | None:
+    """
+    Parses cmd as a single expression and returns it if it is a call of a plain name, else None.
+    """
     try:
-        return re.sub(r"^ *\w+ *= *", "", param.strip())
-    except IndexError:
-        return param
-
-
-def _replace_brackets_outside_quotes(s: str, left_repl: str, right_repl: str) -> str:
-    """Replace [ and ] only when they appear outside of quoted strings."""
-    result = []
-    in_single_quote = False
-    in_double_quote = False
-    i = 0
-    while i < len(s):
-        ch = s[i]
-        # Handle escape sequences
-        if ch == "\\" and i + 1 < len(s):
-            result.append(ch)
-            result.append(s[i + 1])
-            i += 2
-            continue
-        # Track quote state
-        if ch == '"' and not in_single_quote:
-            in_double_quote = not in_double_quote
-            result.append(ch)
-        elif ch == "'" and not in_double_quote:
-            in_single_quote = not in_single_quote
-            result.append(ch)
-        # Replace brackets only outside quotes
-        elif ch == "[" and not in_single_quote and not in_double_quote:
-            result.append(left_repl)
-        elif ch == "]" and not in_single_quote and not in_double_quote:
-            result.append(right_repl)
-        else:
-            result.append(ch)
-        i += 1
-    return "".join(result)
-
-
-def func_str_parts(cmd: str) -> tuple[str, list[str]]:
+        tree = ast.parse(cmd, "<call>", mode="eval")
+    except (SyntaxError, ValueError, MemoryError, RecursionError):
+        return None
+    if isinstance(tree.body, ast.Call) and isinstance(tree.body.func, ast.Name):
+        return tree.body
+    return None
+
+
+@lru_cache(maxsize=4096)
+def func_str_parts(cmd: str) -> tuple[str, tuple[str, ...]]:
     """
     returns the function name and parameter list from a call within a string.
     E.g.,
     func_str_parts("OpenDoor(key='home', knob_right=True, combination=[3,4,2,3])")
     returns
-    'OpenDoor', ["key='home'", 'knob_right=True', 'combination=[3,4,2,3]']
+    'OpenDoor', ("key='home'", 'knob_right=True', 'combination=[3,4,2,3]')
     """
-    # Use re.DOTALL so . matches newlines (YAML multi-line strings may contain them)
-    func_pattern = re.compile(r"(\w+)\s*\((.*)\)$", re.DOTALL)
-    split_pattern = regex.compile(r'"[^"]*"(*SKIP)(*FAIL)|,\s*')
-
-    # Normalize whitespace: collapse newlines/tabs/multiple spaces to single space
-    # This handles YAML multi-line strings that span multiple lines
-    normalized_cmd = re.sub(r"\s+", " ", cmd.strip())
-
-    # Only replace brackets outside of quoted strings to preserve variable specifiers
-    prepped = _replace_brackets_outside_quotes(normalized_cmd, '"(LEFT) ', ' (RIGHT)"')
-    func = func_pattern.fullmatch(prepped)
-    if func is None:
+    cmd = cmd.strip()
+    call = _parse_call(cmd)
+    if call is None:
         raise ValueError(f"String is not a valid function call: {cmd!r}")
 
-    fn = func.group(1)
-    params = func.group(2)
-    # if group(2) could ever be None, guard it:
-    # params = func.group(2) or ""
-
-    param_list = split_pattern.split(params)
-    param_list = [item.replace('"(LEFT) ', "[").replace(' (RIGHT)"', "]") for item in param_list]
-
-    return fn, param_list
-
-
-def remove_seq_boundaries(seq_str: str) -> str:
-    """
-    Removes all Python sequence identifiers.
-    E.g.,
-    remove_seq_boundaries("[1,2,2]")
-    returns
-    "1,2,2"
-    """
-    return re.sub(r"[\[\]\(\)\{\}]", "", seq_str.strip())
+    # Parameters come back as their source text, with whitespace collapsed to single spaces
+    # (YAML multi-line strings can split a call across several lines)
+    params = sorted(chain(call.args, call.keywords), key=lambda node: (node.lineno, node.col_offset))
+    return call.func.id, tuple(_WHITESPACE.sub(" ", ast.get_source_segment(cmd, node)) for node in params)
 
 
+@lru_cache(maxsize=4096)
 def is_safe_value(value_str: str) -> bool:
     """
-    Returns True if value_str is of type ast.Constant, otherwise False.
-    If value_str is a sequence, recursively checks to make sure that all items
-    are of ast.Constant, otherwise False.
+    Returns True if value_str is a Python literal: a constant, or a list, tuple, set or dict
+    built (recursively) only from constants. Otherwise False.
     """
     if not value_str.strip():
         return True
 
     try:
-        tree = ast.parse(value_str, "<stdin>")
-        ast_value_type = type(tree.body[0].__dict__["value"])
+        # eval mode parses a single expression, so the tree's body is the value itself
+        tree = ast.parse(value_str.strip(), "<value>", mode="eval")
     except SyntaxError:
         print(f"ERROR: {value_str} is a mal-formed Python value.")
         return False
+    except (ValueError, MemoryError, RecursionError):
+        return False
+
+    try:
+        return _is_literal_node(tree.body)
+    except RecursionError:
+        return False
 
-    if ast_value_type is ast.Constant:
-        return True
-    elif ast_value_type in (ast.List, ast.Tuple):
-        _seq = re.split(r" *, *", remove_seq_boundaries(value_str))
 
-        return all(is_safe_value(item) for item in _seq)
-    else:
+@lru_cache(maxsize=4096)
+def is_safe_call(cmd: str) -> bool:
+    """
+    Returns True if cmd is a single call of a plain name whose positional and keyword arguments
+    are all literals (see is_safe_value). The whole string is parsed, so this checks exactly
+    what eval() would run. E.g.,
+    is_safe_call("OpenDoor(key='home', combination=[3,4,2,3])") returns True
+    is_safe_call("OpenDoor(key=open('x').read())") returns False
+    """
+    call = _parse_call(cmd.strip())
+    if call is None:
         return False
+    try:
+        # *args is an ast.Starred and **kwargs a keyword without a name; neither is a literal
+        return all(_is_literal_node(arg) for arg in call.args) and all(
+            keyword.arg is not None and _is_literal_node(keyword.value) for keyword in call.keywords
+        )
+    except RecursionError:
+        return False
+
+
+def _is_literal_node(node: ast.AST) -> bool:
+    """
+    True if node is a constant, a signed number, or a list/tuple/set/dict whose items are
+    (recursively) the same. Only the tree is inspected; nothing is evaluated.
+    """
+    if isinstance(node, ast.Constant):
+        return True
+    if isinstance(node, ast.UnaryOp):
+        return (
+            isinstance(node.op, (ast.UAdd, ast.USub))
+            and isinstance(node.operand, ast.Constant)
+            and type(node.operand.value) in (int, float, complex)
+        )
+    if isinstance(node, (ast.List, ast.Tuple, ast.Set)):
+        return all(_is_literal_node(item) for item in node.elts)
+    if isinstance(node, ast.Dict):
+        # a None key is a **mapping unpack
+        return all(key is not None and _is_literal_node(key) for key in node.keys) and all(
+            _is_literal_node(value) for value in node.values
+        )
+    return False
 
 
 if __name__ == "__main__":
@@ -1,7 +1,7 @@
+from collections.abc import Iterable, Iterator
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from itertools import chain
 from pathlib import Path
-import re
 import tempfile
 
 from gtts import gTTS
@@ -10,6 +10,23 @@ from munch import Munch
 from gemsrun import log
 from gemsrun.utils import audiocache, gemsutils as gu
 
+# gTTS downloads are network-bound, so more workers than cores is fine
+_TTS_DOWNLOAD_WORKERS = 8
+
+# Speech hashes known to have a cached WAV. Filled from one listing of the cache folder on first use,
+# then kept current as phrases are pre-rendered, so later pre-renders don't touch the disk to check.
+_CACHED_HASHES: set[str] = set()
+_cached_hashes_loaded = False
+
+
+def _known_cached_hashes() -> set[str]:
+    global _cached_hashes_loaded
+    if not _cached_hashes_loaded:
+        cache_folder = audiocache.get_cache_folder()
+        _CACHED_HASHES.update(path.stem.removeprefix("speech_") for path in cache_folder.glob("speech_*.wav"))
+        _cached_hashes_loaded = True
+    return _CACHED_HASHES
+
 
 def find_tts_folder(media_folder: Path, temp_folder: Path) -> Path:
     """
@@ -20,21 +37,25 @@ def find_tts_folder(media_folder: Path, temp_folder: Path) -> Path:
     Args:
         media_folder: Legacy parameter, no longer used (kept for API compatibility)
         temp_folder: Preferred temp folder location
+
+    Raises:
+        RuntimeError: if neither temp_folder nor the system temp fallback is writable
     """
     _ = media_folder  # Unused, kept for API compatibility
 
-    try:
-        temp_folder.mkdir(parents=True, exist_ok=True)
-        # Test if we can write to the temp folder (no network call needed)
-        test_path = Path(temp_folder, "tts_test.tmp")
-        test_path.write_text("test")
-        test_path.unlink(missing_ok=True)
-        tts_folder = temp_folder
-    except Exception:
-        tts_folder = Path(tempfile.gettempdir(), "gemsruntemp")
-        tts_folder.mkdir(parents=True, exist_ok=True)
+    candidates = (Path(temp_folder), Path(tempfile.gettempdir(), "gemsruntemp"))
+    for candidate in candidates:
+        try:
+            candidate.mkdir(parents=True, exist_ok=True)
+            # Test if we can write here (local only, no network call needed)
+            probe = candidate / ".tts_write_test"
+            probe.touch()
+            probe.unlink()
+            return candidate.resolve()
+        except OSError as e:
+            log.debug(f"TTS folder candidate {candidate} is not writable: {e}")
 
-    return tts_folder.resolve()
+    raise RuntimeError(f"No writable folder for TTS downloads (tried {', '.join(str(c) for c in candidates)})")
 
 
 def _download_tts_mp3(speech: str, speech_hash: str, temp_folder: Path) -> Path | None:
@@ -49,6 +70,35 @@ def _download_tts_mp3(speech: str, speech_hash: str, temp_folder: Path) -> Path
         return None
 
 
+_SAY_TEXT_LEN = len("SayText")
+
+
+def _say_text_candidates(actions: Iterable[Munch]) -> Iterator[str]:
+    """Yields the action strings of enabled SayText actions that can be pre-rendered."""
+    for action in actions:
+        if not action["Enabled"]:
+            continue
+        action_str = action["Action"].lstrip()
+        if not action_str.startswith("SayText"):
+            continue
+        # Skip actions with variable specifiers (can't pre-render); only the part after the name can hold one
+        if action_str.find("[", _SAY_TEXT_LEN) < 0 and action_str.find("$", _SAY_TEXT_LEN) < 0:
+            yield action_str
+
+
+def _quoted_text(text: str) -> str | None:
+    """Returns the first non-empty double-quoted span in text (without the quotes), or None."""
+    start = text.find('"')
+    while start >= 0:
+        end = text.find('"', start + 1)
+        if end < 0:
+            return None
+        if end > start + 1:
+            return text[start + 1 : end]
+        start = end
+    return None
+
+
 def render_tts_from_google(db: Munch) -> bool:
     """
     Pre-render TTS resources and cache them as WAV files.
@@ -56,39 +106,43 @@ def render_tts_from_google(db: Munch) -> bool:
     (pygame.mixer is not thread-safe).
     """
     try:
-        say_pattern = re.compile(r"\"([^\"]+)\"")
-
         # Temp folder for mp3 downloads
         temp_folder = Path(tempfile.gettempdir(), "gemsruntemp")
         temp_folder.mkdir(parents=True, exist_ok=True)
 
-        # Get all actions from global, pocket, views, and objects
-        actions = list(chain(db.Global.GlobalActions.values(), db.Global.PocketActions.values()))
-        for view in db.Views.values():
-            actions.extend(list(view.Actions.values()))
-            for _object in view.Objects.values():
-                actions.extend(list(_object.Actions.values()))
+        # Stream all actions from global, pocket, views, and objects (one pass over the views, no copies).
+        # Munch is a dict, so plain item access is used here to skip its __getattr__ fallback.
+        _global = db["Global"]
+        actions = chain(
+            _global["GlobalActions"].values(),
+            _global["PocketActions"].values(),
+            chain.from_iterable(
+                chain(
+                    view["Actions"].values(),
+                    chain.from_iterable(_object["Actions"].values() for _object in view["Objects"].values()),
+                )
+                for view in db["Views"].values()
+            ),
+        )
 
         # Collect unique phrases that need downloading (deduplicate by hash)
         seen_hashes: set[str] = set()
+        cached_hashes = _known_cached_hashes()
         phrases_to_download: list[tuple[str, str]] = []
-        for action in actions:
-            # Skip actions with variable specifiers (can't pre-render)
-            if action.Enabled and "SayText" in action.Action and "[" not in action.Action and "$" not in action.Action:
-                if match := say_pattern.search(string=action.Action):
-                    speech = match.group().strip().replace('"', "")
-                    speech_hash = gu.string_hash(speech)
+        for action_str in _say_text_candidates(actions):
+            if speech := _quoted_text(action_str):
+                speech_hash = gu.string_hash(speech)
 
-                    if speech_hash in seen_hashes:
-                        continue
-                    seen_hashes.add(speech_hash)
+                if speech_hash in seen_hashes:
+                    continue
+                seen_hashes.add(speech_hash)
 
-                    # Skip if already cached as WAV
-                    if audiocache.is_tts_cached(speech_hash):
-                        log.debug(f"TTS already cached: speech_{speech_hash}.wav")
-                        continue
+                # Skip if already cached as WAV
+                if speech_hash in cached_hashes:
+                    log.debug(f"TTS already cached: speech_{speech_hash}.wav")
+                    continue
 
-                    phrases_to_download.append((speech, speech_hash))
+                phrases_to_download.append((speech, speech_hash))
 
         if not phrases_to_download:
             return True
@@ -97,7 +151,7 @@ def render_tts_from_google(db: Munch) -> bool:
 
         # Phase 1: Download mp3s in parallel (network I/O, thread-safe)
         downloaded: list[tuple[Path, str]] = []
-        with ThreadPoolExecutor(max_workers=4) as executor:
+        with ThreadPoolExecutor(max_workers=_TTS_DOWNLOAD_WORKERS) as executor:
             futures = {
                 executor.submit(_download_tts_mp3, speech, speech_hash, temp_folder): (
                     speech,
@@ -107,7 +161,12 @@ def render_tts_from_google(db: Munch) -> bool:
             }
             for future in as_completed(futures):
                 speech, speech_hash = futures[future]
-                mp3_path = future.result()
+                try:
+                    mp3_path = future.result()
+                except Exception as e:
+                    # one failed phrase must not cost the rest of the batch
+                    log.warning(f"TTS download for '{speech[:30]}...' failed: {e}")
+                    continue
                 if mp3_path is not None:
                     downloaded.append((mp3_path, speech_hash))
 
@@ -115,6 +174,7 @@ def render_tts_from_google(db: Munch) -> bool:
         for mp3_path, speech_hash in downloaded:
             cached_wav = audiocache.cache_tts_from_mp3(mp3_path, speech_hash)
             if cached_wav:
+                _CACHED_HASHES.add(speech_hash)
                 log.debug(f"Pre-rendered TTS: speech_{speech_hash} -> {cached_wav.name}")
             # Clean up temp mp3
             mp3_path.unlink(missing_ok=True)